@@ -1,6 +1,7 @@
 from PySide6.QtCore import QRunnable
 
 from source.models.pdf_data_model import Pdf
+from source.services.runner_signals import RunnerSignals
 from source.services.services import Services
 
 
@@ -9,7 +10,13 @@ class LLMServiceRunner(QRunnable):
     def __init__(self, pdf: Pdf):
         super().__init__()
         self._pdf = pdf
+        self.signals = RunnerSignals()
 
     def run(self):
-        summaries = Services().llm().progressive_summarize(self._pdf.documents)
+        try:
+            summaries = Services().llm().progressive_summarize(self._pdf.documents)
+        except Exception:
+            self.signals.failed.emit(self._pdf.path.name)
+            raise
         Services().pdf().update_summaries(self._pdf.path.name, summaries)
+        self.signals.finished.emit(self._pdf.path.name)
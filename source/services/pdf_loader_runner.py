@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from PySide6.QtCore import QRunnable
+
+from source.services.runner_signals import RunnerSignals
+from source.services.services import Services
+
+
+class PdfLoaderRunner(QRunnable):
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self._path = path
+        self.signals = RunnerSignals()
+
+    def run(self):
+        try:
+            pages = Services().pdf().load_pdf_pages(self._path)
+            documents = Services().pdf().split_pages(pages)
+            # The loader already extracted every page, reuse the first one instead of parsing the file again
+            metadata = Services().llm().parse_research_paper_metadata(pages[0].page_content)
+            pdf = Services().pdf().create_pdf_obj(self._path, documents, metadata)
+        except Exception:
+            self.signals.failed.emit(self._path.name)
+            raise
+        Services().pdf().append_data(self._path.name, pdf)
+        Services().file_handling().save_pdf_obj_as_json(self._path.name, pdf)
+        self.signals.finished.emit(self._path.name)
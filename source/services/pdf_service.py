@@ -2,8 +2,8 @@ from pathlib import Path
 
 from langchain.docstore.document import Document
 from langchain_community.document_loaders import PyPDFLoader
+from langchain_text_splitters import RecursiveCharacterTextSplitter
 from llama_index.readers.file import PyMuPDFReader
-from pypdf import PdfReader
 from PySide6.QtCore import Slot
 
 from source.models.model_store import ModelStore
@@ -21,19 +21,12 @@ class PdfService(Service):
     def name() -> str:
         return ServiceName.PDF_SERVICE.name
 
-    def load_pdf(self, path: Path) -> list[Document]:
+    def load_pdf_pages(self, path: Path) -> list[Document]:
         pdf_loader = PyPDFLoader(str(path))
-        documents = pdf_loader.load_and_split()
-        return documents
-
-    def get_first_page_pdf_text(self, pdf_path: Path) -> str:
-        pdf = PdfReader(pdf_path)
-        first_page = pdf.pages[0]
-        contents = first_page.get_contents()
-        texts = first_page.extract_text()
-        print(contents)
-        print(texts)
-        return texts
+        return pdf_loader.load()
+
+    def split_pages(self, pages: list[Document]) -> list[Document]:
+        return RecursiveCharacterTextSplitter().split_documents(pages)
 
     def append_data(self, key: str, value: Pdf):
         ModelStore().pdf().append_data(key, value)
@@ -42,7 +35,4 @@ class PdfService(Service):
         ModelStore().pdf().add_summaries(key, value)
 
     def create_pdf_obj(self, path: Path, documents: list[Document], metadata: dict):
-        print(path)
-        print(documents)
-        print(metadata)
         return Pdf(filename=path.name, path=path, documents=documents, metadata=metadata, summaries=None)
@@ -0,0 +1,9 @@
+from PySide6.QtCore import QObject, Signal
+
+
+class RunnerSignals(QObject):
+    """Signals for QRunnable jobs, which can't emit signals themselves"""
+
+    # Both carry the key (file name) of the PDF the runner worked on
+    finished = Signal(str)
+    failed = Signal(str)
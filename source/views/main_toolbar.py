@@ -1,11 +1,12 @@
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, QThreadPool, Slot
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QFileDialog, QSizePolicy, QToolBar, QToolButton, QWidget
+from PySide6.QtWidgets import QFileDialog, QProgressBar, QSizePolicy, QToolBar, QToolButton, QWidget
 
 from source.common.enums.icon import Icon
-from source.services.services import Services
+from source.models.model_store import ModelStore
+from source.services.pdf_loader_runner import PdfLoaderRunner
 
 
 class MainToolBar(QToolBar):
@@ -22,9 +23,21 @@ class MainToolBar(QToolBar):
         add_pdf_button.setIcon(QIcon(Icon.PLUS.value))
         add_pdf_button.clicked.connect(self.on_add_pdf_button_pressed)
 
+        # Indeterminate bar shown while any import is running in the background
+        import_progress_bar = QProgressBar()
+        import_progress_bar.setRange(0, 0)
+        import_progress_bar.setMaximumWidth(100)
+
+        # Keys (file names) of PDFs currently being imported
+        self._importing: set[str] = set()
+
         self.addWidget(spacer_widget)
+        self._import_progress_action = self.addWidget(import_progress_bar)
+        self._import_progress_action.setVisible(False)
         self.addWidget(add_pdf_button)
 
+        ModelStore().pdf().data_added.connect(self.on_import_finished)
+
     @Slot()
     def on_add_pdf_button_pressed(self):
         dialog = QFileDialog(self)
@@ -34,9 +47,17 @@ class MainToolBar(QToolBar):
             pdf_path = dialog.selectedFiles()[0]
             if pdf_path:
                 pdf_path = Path(pdf_path)
-                documents = Services().pdf().load_pdf(pdf_path)
-                first_page_text = Services().pdf().get_first_page_pdf_text(pdf_path)
-                metadata = Services().llm().parse_research_paper_metadata(first_page_text)
-                pdf = Services().pdf().create_pdf_obj(pdf_path, documents, metadata)
-                Services().pdf().append_data(pdf_path.name, pdf)
-                Services().file_handling().save_pdf_obj_as_json(pdf_path.name, pdf)
+                if pdf_path.name in self._importing:
+                    return
+                self._importing.add(pdf_path.name)
+                self._import_progress_action.setVisible(True)
+
+                # Parsing and the metadata LLM call would block the UI, the card is added via data_added
+                runner = PdfLoaderRunner(pdf_path)
+                runner.signals.failed.connect(self.on_import_finished)
+                QThreadPool.globalInstance().start(runner)
+
+    @Slot(str)
+    def on_import_finished(self, key: str):
+        self._importing.discard(key)
+        self._import_progress_action.setVisible(bool(self._importing))
@@ -60,7 +60,7 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def on_pdf_data_added(self, key: str):
-        paper_metadata = ModelStore().pdf().data.get(key)
+        paper_metadata = ModelStore().pdf().get_pdf_obj(key)
         if not paper_metadata:
             return
         self._add_item_card_widget(paper_metadata)
@@ -22,8 +22,8 @@ class PdfViewerDialog(QWidget):
         app_dir = QDir.currentPath()
 
         viewer_path = QDir(app_dir).filePath("ext/PDF_js/PDF_js/web/viewer.html")
-        viewer_url = QUrl.fromLocalFile(viewer_path)
-        self.browser.load(viewer_url)
+        self._viewer_url = QUrl.fromLocalFile(viewer_path)
+        # Loading viewer.html without a file opens the bundled sample PDF, so go straight to ours
         self.load_pdf()
 
     def open_file_dialog(self):
@@ -37,6 +37,5 @@ class PdfViewerDialog(QWidget):
 
     def load_pdf(self):
         encoded_pdf_url = QUrl.fromLocalFile(self._pdf_path).toString()
-        full_url = f"{self.browser.url().toString()}?file={encoded_pdf_url}"
-        print(full_url)
+        full_url = f"{self._viewer_url.toString()}?file={encoded_pdf_url}"
         self.browser.setUrl(QUrl(full_url))
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QHBoxLayout, QLineEdit, QPushButton, QTextEdit, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QHBoxLayout, QLineEdit, QPlainTextEdit, QPushButton, QVBoxLayout, QWidget
 
 
 class ChatWidget(QWidget):
@@ -11,7 +11,7 @@ class ChatWidget(QWidget):
     def initUI(self):
         layout = QVBoxLayout()
 
-        self.chatDisplay = QTextEdit()
+        self.chatDisplay = QPlainTextEdit()
         self.chatDisplay.setReadOnly(True)
         layout.addWidget(self.chatDisplay)
 
@@ -32,7 +32,7 @@ class ChatWidget(QWidget):
         message = self.inputField.text()
         if message:
             message = message + "\n\n"
-            self.chatDisplay.append(f"You: {message}")
+            self.chatDisplay.appendPlainText(f"You: {message}")
             self.inputField.clear()
             # TODO: Add here
             # Here you would typically send the message to a server
@@ -42,8 +42,13 @@ class ItemCardWidget(QWidget):
         self.setFixedHeight(300)
         self.setFixedWidth(250)
 
+        self.setProperty("selected", False)
         self.setStyleSheet(
             """
+            #ItemCardWidget[selected="true"] {
+            border: 2px solid #8edf91;
+            }
+
             ResearchTitleLabel {
             font-size: 24px;
             font-family: 'Trebuchet MS', sans-serif;
@@ -76,92 +81,32 @@ class ItemCardWidget(QWidget):
 
         self.is_selected = False
 
-        self._pdf_dialog = PdfViewerDialog(self._pdf.path)
-        self._pdf_dialog.hide()
-        self._note_widget = NoteWidgetDialog(self._pdf)
-        self._note_widget.hide()
+        # Built on first open, a web view per card is too heavy to create upfront
+        self._pdf_dialog: PdfViewerDialog | None = None
+        self._note_widget: NoteWidgetDialog | None = None
 
     def mousePressEvent(self, event):
         # self.clicked.emit()  # Emit clicked signal
         self.toggle_selection()
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        if self._pdf_dialog is None:
+            self._pdf_dialog = PdfViewerDialog(self._pdf.path)
+        if self._note_widget is None:
+            self._note_widget = NoteWidgetDialog(self._pdf)
         self._pdf_dialog.show()
-        self._pdf_dialog.load_pdf()
         self._note_widget.show()
 
         return super().mouseDoubleClickEvent(event)
 
     def toggle_selection(self):
         self.is_selected = not self.is_selected
-        if self.is_selected:
-            self.setStyleSheet(
-                """
-                #ItemCardWidget {
-                    border: 2px solid #8edf91;
-                }
-            ResearchTitleLabel {
-            font-size: 24px;
-            font-family: 'Trebuchet MS', sans-serif;
-            margin: 0px;
-            padding: 0px;
-            }
-
-            ResearchYearLabel {
-            color: #868786;
-            background-color: #e6e7e7;
-            padding: 2px;  /* Adjust padding to reduce excess background */
-            margin: 0px;
-            font-weight: bold;
-            border-radius: 5px;
-            }
-
-            AuthorsLabel {
-            color: #5d5c5d;
-            margin: 0px;
-            padding: 0px;
-            }
-
-            ResearchAbstractLabel {
-            margin: 0px;
-            padding: 0px;
-            color: #a5a5a4;
-            }
-        """
-            )
-        else:
-            self.setStyleSheet(
-                """
-
-            ResearchTitleLabel {
-            font-size: 24px;
-            font-family: 'Trebuchet MS', sans-serif;
-            margin: 0px;
-            padding: 0px;
-            }
-
-            ResearchYearLabel {
-            color: #868786;
-            background-color: #e6e7e7;
-            padding: 2px;  /* Adjust padding to reduce excess background */
-            margin: 0px;
-            font-weight: bold;
-            border-radius: 5px;
-            }
-
-            AuthorsLabel {
-            color: #5d5c5d;
-            margin: 0px;
-            padding: 0px;
-            }
-
-            ResearchAbstractLabel {
-            margin: 0px;
-            padding: 0px;
-            color: #a5a5a4;
-            }
-        """
-            )
+        # Only the card border depends on the selection, so repolish the card instead of
+        # re-applying the style sheet to every label
+        self.setProperty("selected", self.is_selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
 
 
 class ResearchTitleLabel(QLabel):
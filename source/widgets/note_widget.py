@@ -17,10 +17,8 @@ class NoteWidgetDialog(QWidget):
         self._pdf = pdf
         # TODO: HS: 7.7.2024
         # maybe only need key to pdf instead of passing pdf obj
-        self._thread_pool = QThreadPool()
+        self._thread_pool = QThreadPool.globalInstance()
         self._title = self.add_line_breaks(pdf.metadata["title"])
-        self._pdf_model_store = ModelStore().pdf()
-        self._pdf_model_store.summaries_added.connect(self.on_summaries_finished_generated)
         self.initUI()
 
         # TODO: HS: 12.7.2024
@@ -65,7 +63,6 @@ class NoteWidgetDialog(QWidget):
         self.summary_button.clicked.connect(self.on_summary_button_clicked)
 
         self._word_list = []
-        self.summary_button.clicked.connect(self.start_updates)
         self.current_index = 0
 
         self.timer = QTimer(self)
@@ -99,10 +96,15 @@ class NoteWidgetDialog(QWidget):
         pdf = ModelStore().pdf().get_pdf_obj(self._pdf.path.name)
         if pdf is None:
             return
+        # Stays disabled until the summary has been revealed, so a second click can't start another LLM run
+        self.summary_button.setEnabled(False)
         if not pdf.summaries:
             self.summary_button.spin()
 
             runner = LLMServiceRunner(pdf)
+            # Listen to this runner only, summaries_added also fires for every other paper
+            runner.signals.finished.connect(self.on_summaries_generated)
+            runner.signals.failed.connect(self.on_summaries_failed)
 
             self._thread_pool.start(runner, priority=5)
         if pdf.summaries:
@@ -124,28 +126,29 @@ class NoteWidgetDialog(QWidget):
         # QTimer.singleShot(3000, self.summary_button.stop_spin)
         self.summary_button.stop_spin()
 
+    @Slot(str)
+    def on_summaries_generated(self, key: str):
+        pdf = ModelStore().pdf().get_pdf_obj(key)
+        self.on_summaries_finished_generated(pdf.summaries["output_text"])
+
+    @Slot(str)
+    def on_summaries_failed(self, key: str):
+        self.summary_button.stop_spin()
+        self.summary_button.setEnabled(True)
+
     def _load_summaries(self):
         self.on_summaries_finished_generated(self._summaries)
 
-    def start_updates(self):
-        self.current_index = 0
-        self.note_edit.clear()
-        self.timer.start(50)  # Update every 1000 ms (1 second)
-        self.summary_button.setEnabled(False)
-
     def update_text(self):
         if self.current_index < len(self._word_list):
-            current_text = self.note_edit.toPlainText()
             new_word = self._word_list[self.current_index]
-            if current_text:
-                updated_text = current_text + " " + new_word
-            else:
-                updated_text = new_word
-            self.note_edit.setPlainText(updated_text)
-
-            cursor = self.note_edit.textCursor()
+            # Append through a cursor of our own so the user's cursor and selection stay where they are
+            cursor = QTextCursor(self.note_edit.document())
             cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.note_edit.setTextCursor(cursor)
+            if self.note_edit.document().isEmpty():
+                cursor.insertText(new_word)
+            else:
+                cursor.insertText(" " + new_word)
 
             self.current_index += 1
         else: